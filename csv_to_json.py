@@ -16,36 +16,88 @@ Options:
                           Options: minimal, all, nonnumeric, none
     -s, --skipinitialspace Skip initial space in CSV fields (default: False)
     -i, --indent          JSON indentation level (default: 4)
-    -p, --pretty          Pretty print JSON output (default: True)
+    -p, --pretty          Pretty print JSON output (default: only when
+                          writing to a terminal; compact output is faster
+                          and smaller for files and pipes)
     -r, --records         Output as array of records instead of array of objects
                           (default: False)
     -a, --auto-types      Automatically convert string values to appropriate types
                           (default: True)
     -e, --encoding        Character encoding for input/output files (default: utf-8)
+    -v, --verbose         Enable informational progress messages
+    --engine              CSV parsing engine (default: python)
+                          Options: python, arrow (requires pyarrow)
     -N, --null-values     Comma-separated values to be treated as null (default: "")
     -h, --help            Show this help message and exit
 """
 
 import argparse
+import codecs
+import collections
 import csv
+import datetime
+import itertools
 import json
+import math
+import mmap
 import sys
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union, Tuple, IO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, List, Dict, Any, Optional, Union, Tuple, IO
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it we fall back to per-cell parsing.
+    np = None
 
-def setup_logging():
-    """Configure logging for the application."""
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it we fall back to the NumPy or
+    # per-cell parsing paths.
+    njit = None
+
+if np is None:
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # PyArrow is optional: it backs the 'arrow' engine only.
+    pa = None
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: without it serialization uses the stdlib.
+    orjson = None
+
+
+def setup_logging(verbose: bool = False):
+    """Configure logging for the application.
+
+    Args:
+        verbose: Enable INFO-level progress messages; default is
+            warnings and errors only, keeping log formatting and stderr
+            writes off the conversion path
+    """
     logging.basicConfig(
-        level=logging.INFO,
+        level=logging.INFO if verbose else logging.WARNING,
         format='%(levelname)s: %(message)s'
     )
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments.
-    
+
+    Args:
+        argv: Argument list to parse instead of sys.argv (for tests and
+            library embedding)
+
     Returns:
         argparse.Namespace: Parsed command line arguments
     """
@@ -99,9 +151,10 @@ def parse_arguments() -> argparse.Namespace:
     
     parser.add_argument(
         '-p', '--pretty',
-        help='Pretty print JSON output',
+        help='Pretty print JSON output (default: only when writing to '
+             'a terminal)',
         action='store_true',
-        default=True
+        default=None
     )
     
     parser.add_argument(
@@ -137,40 +190,94 @@ def parse_arguments() -> argparse.Namespace:
         default='utf-8'
     )
     
+    parser.add_argument(
+        '-v', '--verbose',
+        help='Enable informational progress messages',
+        action='store_true'
+    )
+
+    parser.add_argument(
+        '--engine',
+        help='CSV parsing engine: python (stdlib) or arrow '
+             '(PyArrow multithreaded reader, requires pyarrow)',
+        choices=['python', 'arrow'],
+        default='python'
+    )
+
     parser.add_argument(
         '-N', '--null-values',
         help='Comma-separated values to be treated as null',
         default=''
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+# Built once at import: get_quoting_mode sits on the config path, which
+# re-enters per chunk once streaming/parallel parsing dispatches through it.
+_QUOTING_MODES = {
+    'minimal': csv.QUOTE_MINIMAL,
+    'all': csv.QUOTE_ALL,
+    'nonnumeric': csv.QUOTE_NONNUMERIC,
+    'none': csv.QUOTE_NONE
+}
+
+# Default null sentinels when the user supplies none
+_DEFAULT_NULL_VALUES = frozenset(('',))
 
 
 def get_quoting_mode(quoting_str: str) -> int:
     """Convert quoting mode string to csv module constant.
-    
+
     Args:
         quoting_str: String representation of quoting mode
-        
+
     Returns:
         int: Corresponding csv module quoting constant
     """
-    quoting_modes = {
-        'minimal': csv.QUOTE_MINIMAL,
-        'all': csv.QUOTE_ALL,
-        'nonnumeric': csv.QUOTE_NONNUMERIC,
-        'none': csv.QUOTE_NONE
-    }
-    return quoting_modes.get(quoting_str.lower(), csv.QUOTE_MINIMAL)
+    return _QUOTING_MODES.get(quoting_str.lower(), csv.QUOTE_MINIMAL)
+
+
+# Sentinel words recognized during type inference. Frozensets give O(1)
+# hashed membership tests instead of linear tuple scans, built once at
+# import instead of per cell.
+_TRUE_VALUES = frozenset(('true', 'yes', 'y', '1'))
+_FALSE_VALUES = frozenset(('false', 'no', 'n', '0'))
+_NULL_WORDS = frozenset(('null', 'none', 'na', 'n/a'))
+
+# Character classes for the branchless numeric prefilter. A translate
+# against the 256-byte table below ORs together the classes present in a
+# cell, so non-numeric cells are rejected without raising exceptions.
+_CLASS_DIGIT = 1
+_CLASS_DOT = 2
+_CLASS_E = 4
+_CLASS_SIGN = 8
+_CLASS_UNDERSCORE = 16
+_CLASS_OTHER = 32
+
+
+def _build_char_class_table() -> bytes:
+    """Build the 256-byte character-class lookup table."""
+    table = bytearray([_CLASS_OTHER] * 256)
+    for byte in b'0123456789':
+        table[byte] = _CLASS_DIGIT
+    table[ord('.')] = _CLASS_DOT
+    table[ord('e')] = table[ord('E')] = _CLASS_E
+    table[ord('+')] = table[ord('-')] = _CLASS_SIGN
+    table[ord('_')] = _CLASS_UNDERSCORE
+    return bytes(table)
 
 
-def try_parse_value(value: str, auto_types: bool, null_values: List[str]) -> Any:
+_CHAR_CLASS = _build_char_class_table()
+
+
+def try_parse_value(value: str, auto_types: bool, null_values: Collection[str]) -> Any:
     """Try to parse a string value into an appropriate Python type.
     
     Args:
         value: String value to parse
         auto_types: Whether to automatically convert types
-        null_values: List of strings to treat as null
+        null_values: Collection of strings to treat as null
         
     Returns:
         Parsed value in the most appropriate type
@@ -181,37 +288,623 @@ def try_parse_value(value: str, auto_types: bool, null_values: List[str]) -> Any
     if not auto_types:
         return value
     
-    # Try to convert to appropriate type
+    # Try to convert to appropriate type; normalize exactly once
     value = value.strip()
-    
-    # Check for boolean
-    if value.lower() in ('true', 'yes', 'y', '1'):
-        return True
-    if value.lower() in ('false', 'no', 'n', '0'):
-        return False
-    
-    # Check for null/None
-    if value.lower() in ('null', 'none', 'na', 'n/a'):
-        return None
-    
-    # Check for integer
-    try:
-        if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
+
+    # Check for boolean / null sentinel words. They are at most five
+    # characters, so longer cells skip the lowercase allocation.
+    if len(value) <= 5:
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
+            return True
+        if lowered in _FALSE_VALUES:
+            return False
+        if lowered in _NULL_WORDS:
+            return None
+
+    # Numeric check: one C-level translate classifies every character,
+    # so int()/float() are only attempted on plausible candidates and
+    # plain text never pays for a raised exception.
+    if value.isascii():
+        mask = 0
+        for char_class in set(value.encode('ascii').translate(_CHAR_CLASS)):
+            mask |= char_class
+
+        # Check for integer. The sign test avoids slicing a substring:
+        # the mask guarantees every other character is a digit or sign,
+        # so a single leading '-' is the only valid layout.
+        if mask == _CLASS_DIGIT:
             return int(value)
-    except ValueError:
-        pass
-    
+        if (mask == _CLASS_DIGIT | _CLASS_SIGN
+                and value[0] == '-'
+                and value.find('-', 1) == -1
+                and '+' not in value):
+            return int(value)
+
+        # Check for float
+        if mask & (_CLASS_DOT | _CLASS_E) and not mask & _CLASS_OTHER:
+            # Only plausible numeric characters remain, but float() can
+            # still reject malformed layouts like '1.2.3'.
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        return value
+
+    # Non-ASCII values (e.g. Unicode digits) take the general path
+    # Check for integer. isdigit() accepts Unicode digit characters
+    # (e.g. '²') that int() rejects, so the conversion stays guarded.
+    if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
     # Check for float
     try:
         if '.' in value or 'e' in value.lower():
             return float(value)
     except ValueError:
         pass
-    
+
     # Return as string if no conversion was successful
     return value
 
 
+# Rows boxed per stride while materializing from a TypedColumn, bounding
+# the transient PyObject population.
+_BOX_STRIDE = 1024
+
+
+class TypedColumn:
+    """Packed typed storage for a uniformly typed parsed column.
+
+    Holds the column in one NumPy buffer (int64, float64 or bool) plus
+    an optional null mask instead of one PyObject per cell - an order of
+    magnitude less resident memory for numeric columns, and a
+    cache-friendly layout. Values are boxed back to Python objects in
+    bounded strides only while rows are being materialized.
+    """
+
+    __slots__ = ('values', 'null_mask')
+
+    def __init__(self, values: Any, null_mask: Optional[Any] = None):
+        self.values = values
+        self.null_mask = null_mask
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Any:
+        values = self.values
+        null_mask = self.null_mask
+        for start in range(0, len(values), _BOX_STRIDE):
+            boxed = values[start:start + _BOX_STRIDE].tolist()
+            if null_mask is None:
+                yield from boxed
+            else:
+                for value, is_null in zip(
+                        boxed, null_mask[start:start + _BOX_STRIDE].tolist()):
+                    yield None if is_null else value
+
+    def tolist(self) -> List[Any]:
+        """Materialize the fully boxed column."""
+        return list(self)
+
+
+def parse_column(
+    values: List[str],
+    auto_types: bool,
+    null_values: Collection[str],
+    compact: bool = False
+) -> Any:
+    """Parse a whole column of string values in one vectorized pass.
+
+    Applies the same conversion rules as try_parse_value, but batched with
+    NumPy so the per-cell work (lowercasing, digit checks, int/float
+    conversion) runs in C instead of one Python call per cell.
+
+    Args:
+        values: Column of raw string values
+        auto_types: Whether to automatically convert types
+        null_values: Collection of strings to treat as null
+        compact: Return a TypedColumn (packed buffer plus null mask)
+            instead of a boxed list when the column is uniformly
+            int/float/bool
+
+    Returns:
+        List of parsed values in the most appropriate types, or a
+        TypedColumn when compact applies
+    """
+    col = np.asarray(values, dtype=object)
+    out = np.empty(len(col), dtype=object)
+
+    if null_values:
+        null_mask = np.isin(col, np.asarray(list(null_values), dtype=object))
+    else:
+        null_mask = np.zeros(len(col), dtype=bool)
+
+    if not auto_types:
+        out[:] = col
+        out[null_mask] = None
+        return out.tolist()
+
+    stripped = np.char.strip(col.astype('U'))
+    lower = np.char.lower(stripped)
+
+    # Default: keep the (stripped) string
+    out[:] = stripped
+    out[null_mask] = None
+    remaining = ~null_mask
+
+    # Check for boolean
+    true_mask = remaining & np.isin(lower, list(_TRUE_VALUES))
+    out[true_mask] = True
+    remaining &= ~true_mask
+
+    false_mask = remaining & np.isin(lower, list(_FALSE_VALUES))
+    out[false_mask] = False
+    remaining &= ~false_mask
+
+    # Check for null/None
+    word_null_mask = remaining & np.isin(lower, list(_NULL_WORDS))
+    out[word_null_mask] = None
+    remaining &= ~word_null_mask
+    all_null_mask = null_mask | word_null_mask
+
+    # Check for integer: all digits after at most one leading minus sign
+    body = np.char.lstrip(stripped, '-')
+    int_mask = (
+        remaining
+        & np.char.isdigit(body)
+        & (np.char.str_len(stripped) - np.char.str_len(body) <= 1)
+    )
+    int_values = None
+    if int_mask.any():
+        try:
+            int_values = stripped[int_mask].astype(np.int64)
+        except (ValueError, OverflowError):
+            # Values that do not fit int64 go through Python's
+            # arbitrary-precision int instead. np.char.isdigit accepts
+            # Unicode digit forms (e.g. '²') that int() rejects, so keep
+            # those cells as strings rather than aborting the column.
+            parsed = []
+            for value in stripped[int_mask]:
+                try:
+                    parsed.append(int(value))
+                except ValueError:
+                    parsed.append(value)
+            out[int_mask] = parsed
+        remaining &= ~int_mask
+
+    # Check for float
+    float_mask = remaining & (
+        (np.char.find(stripped, '.') >= 0) | (np.char.find(lower, 'e') >= 0)
+    )
+    float_values = None
+    if float_mask.any():
+        candidates = stripped[float_mask]
+        try:
+            float_values = candidates.astype(np.float64)
+        except ValueError:
+            # Mixed column: fall back to per-cell conversion for the
+            # candidates, keeping non-numeric ones as strings.
+            parsed = []
+            for value in candidates:
+                try:
+                    parsed.append(float(value))
+                except ValueError:
+                    parsed.append(value)
+            out[float_mask] = parsed
+
+    # Uniformly typed columns can stay packed: one typed buffer plus a
+    # null mask instead of a boxed PyObject per cell. int/float columns
+    # are never merged, so JSON output types are unchanged.
+    if compact:
+        n = len(col)
+        n_null = int(all_null_mask.sum())
+        nulls = all_null_mask if n_null else None
+        if int_values is not None and len(int_values) + n_null == n:
+            buffer = np.zeros(n, dtype=np.int64)
+            buffer[int_mask] = int_values
+            return TypedColumn(buffer, nulls)
+        if float_values is not None and len(float_values) + n_null == n:
+            buffer = np.zeros(n, dtype=np.float64)
+            buffer[float_mask] = float_values
+            return TypedColumn(buffer, nulls)
+        if int(true_mask.sum()) + int(false_mask.sum()) + n_null == n and n > n_null:
+            return TypedColumn(true_mask.copy(), nulls)
+
+    # Mixed column: box the typed sub-ranges into the object array
+    if int_values is not None:
+        out[int_mask] = int_values.tolist()
+    if float_values is not None:
+        out[float_mask] = float_values.tolist()
+
+    return out.tolist()
+
+
+class PendingValue:
+    """A cell value whose type inference is deferred until first use.
+
+    Stores the raw CSV string and only runs try_parse_value when the
+    value is actually needed (e.g. at JSON serialization time), caching
+    the result. This avoids paying for inference on cells a consumer
+    never inspects.
+    """
+
+    __slots__ = ('raw', '_null_values', '_value', '_resolved')
+
+    def __init__(self, raw: str, null_values: Collection[str]):
+        self.raw = raw
+        self._null_values = null_values
+        self._value = None
+        self._resolved = False
+
+    def resolve(self) -> Any:
+        """Infer and cache the typed value on first call."""
+        if not self._resolved:
+            self._value = try_parse_value(self.raw, True, self._null_values)
+            self._resolved = True
+        return self._value
+
+    def __repr__(self) -> str:
+        return f'PendingValue({self.raw!r})'
+
+
+class LazyValueEncoder(json.JSONEncoder):
+    """JSON encoder that resolves PendingValue cells at serialization time.
+
+    Also serializes date/time values (produced by the arrow engine's
+    type inference) as ISO 8601 strings, matching orjson's native
+    handling so output does not depend on which encoder runs.
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, PendingValue):
+            return o.resolve()
+        if isinstance(o, (datetime.date, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _json_default(o: Any) -> Any:
+    """Resolve PendingValue and date/time cells for encoders that take a
+    default hook."""
+    if isinstance(o, PendingValue):
+        return o.resolve()
+    if isinstance(o, (datetime.date, datetime.time)):
+        return o.isoformat()
+    raise TypeError(
+        f"Object of type {type(o).__name__} is not JSON serializable"
+    )
+
+
+def _contains_non_finite(data: Any) -> bool:
+    """Return True if any float in the payload is infinite or NaN.
+
+    orjson silently serializes non-finite floats as null instead of
+    raising, so they cannot be caught like out-of-range ints; payloads
+    containing one are detected up front and routed to the stdlib
+    encoder, which emits the baseline Infinity/NaN tokens. The scan
+    short-circuits on the first hit and is far cheaper than a stdlib
+    encode of the whole payload.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, (list, tuple)):
+        return any(_contains_non_finite(item) for item in data)
+    if isinstance(data, dict):
+        return any(_contains_non_finite(value) for value in data.values())
+    if isinstance(data, PendingValue):
+        return _contains_non_finite(data.resolve())
+    return False
+
+
+def dumps_json(data: Any, indent: Optional[int]) -> str:
+    """Serialize data to a JSON string with the fastest available encoder.
+
+    Uses orjson (a native encoder returning UTF-8 bytes) when installed
+    and the indent is one it supports (none, or 2 via OPT_INDENT_2);
+    other indents go through the stdlib encoder. orjson writes non-ASCII
+    characters natively instead of \\u-escaping them; both forms are
+    valid JSON.
+
+    Args:
+        data: Data to serialize
+        indent: JSON indentation level or None
+
+    Returns:
+        JSON string
+    """
+    return dumps_json_bytes(data, indent).decode('utf-8')
+
+
+def dumps_json_bytes(data: Any, indent: Optional[int]) -> bytes:
+    """Serialize data straight to UTF-8 JSON bytes.
+
+    With orjson this is its native output format, so no intermediate
+    Python str is ever built; the stdlib fallback encodes once at the
+    end. Used by the binary write paths, which hand the bytes directly
+    to the output file.
+
+    Args:
+        data: Data to serialize
+        indent: JSON indentation level or None
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if (orjson is not None and indent in (None, 2)
+            and not _contains_non_finite(data)):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            return orjson.dumps(data, option=option, default=_json_default)
+        except TypeError:
+            # orjson rejects ints outside the 64-bit range (and does not
+            # route them through the default hook); retry with the
+            # stdlib encoder, which handles arbitrary-precision ints.
+            pass
+    if indent is None:
+        # Compact separators match orjson and shave the padding bytes
+        return json.dumps(
+            data, separators=(',', ':'), cls=LazyValueEncoder
+        ).encode('utf-8')
+    return json.dumps(data, indent=indent, cls=LazyValueEncoder).encode('utf-8')
+
+
+# Type tags produced by the JIT cell classifier. Cells carry a tag plus,
+# for integers, a parsed value - a struct-of-arrays layout that keeps the
+# per-cell work inside compiled code.
+_TAG_STRING = 0
+_TAG_INT = 1
+_TAG_INT_BIG = 2
+_TAG_FLOAT = 3
+_TAG_TRUE = 4
+_TAG_FALSE = 5
+_TAG_NULL = 6
+
+# Minimum column length before the JIT path is worth its dispatch overhead.
+_JIT_MIN_COLUMN = 4096
+
+# Worker threads for parallel chunk parsing. Capped because the Python
+# parts of chunk conversion still hold the GIL, so extra workers beyond
+# this see diminishing returns.
+_PARSE_WORKERS = max(1, min(os.cpu_count() or 1, 4))
+
+
+def _word_key(word: str) -> int:
+    """Pack a short ASCII word into an integer key for the JIT classifier."""
+    key = 0
+    for byte in word.encode('ascii'):
+        key = (key << 8) | byte
+    return key
+
+
+_KEY_TRUE = _word_key('true')
+_KEY_YES = _word_key('yes')
+_KEY_Y = _word_key('y')
+_KEY_ONE = _word_key('1')
+_KEY_FALSE = _word_key('false')
+_KEY_NO = _word_key('no')
+_KEY_N = _word_key('n')
+_KEY_ZERO = _word_key('0')
+_KEY_NULL = _word_key('null')
+_KEY_NONE = _word_key('none')
+_KEY_NA = _word_key('na')
+_KEY_NA_SLASH = _word_key('n/a')
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _classify_cells(buf, starts, ends, tags, ints):
+        """Classify each cell of a contiguous ASCII byte buffer.
+
+        For each cell [starts[i], ends[i]) this strips whitespace (the
+        stripped window is written back into starts/ends), recognizes the
+        boolean/null sentinel words, parses plain integers, and flags
+        float candidates - all without leaving compiled code.
+        """
+        for i in range(starts.shape[0]):
+            start = starts[i]
+            end = ends[i]
+            while start < end:
+                c = buf[start]
+                if c == 32 or 9 <= c <= 13:
+                    start += 1
+                else:
+                    break
+            while end > start:
+                c = buf[end - 1]
+                if c == 32 or 9 <= c <= 13:
+                    end -= 1
+                else:
+                    break
+            starts[i] = start
+            ends[i] = end
+            n = end - start
+            if n == 0:
+                tags[i] = _TAG_STRING
+                continue
+
+            # Boolean and null sentinel words (case-insensitive)
+            if n <= 5:
+                key = 0
+                for p in range(start, end):
+                    c = buf[p]
+                    if 65 <= c <= 90:
+                        c += 32
+                    key = (key << 8) | c
+                if (key == _KEY_TRUE or key == _KEY_YES
+                        or key == _KEY_Y or key == _KEY_ONE):
+                    tags[i] = _TAG_TRUE
+                    continue
+                if (key == _KEY_FALSE or key == _KEY_NO
+                        or key == _KEY_N or key == _KEY_ZERO):
+                    tags[i] = _TAG_FALSE
+                    continue
+                if (key == _KEY_NULL or key == _KEY_NONE
+                        or key == _KEY_NA or key == _KEY_NA_SLASH):
+                    tags[i] = _TAG_NULL
+                    continue
+
+            # Integer: all digits after at most one leading minus sign
+            pos = start
+            if buf[pos] == 45:  # '-'
+                pos += 1
+            all_digits = pos < end
+            p = pos
+            while p < end:
+                c = buf[p]
+                if c < 48 or c > 57:
+                    all_digits = False
+                    break
+                p += 1
+            if all_digits:
+                if end - pos <= 18:
+                    value = 0
+                    for p in range(pos, end):
+                        value = value * 10 + (buf[p] - 48)
+                    if buf[start] == 45:
+                        value = -value
+                    ints[i] = value
+                    tags[i] = _TAG_INT
+                else:
+                    # Too many digits for int64; parsed in Python instead
+                    tags[i] = _TAG_INT_BIG
+                continue
+
+            # Float candidate: contains a dot or an exponent marker
+            has_float_marker = False
+            for p in range(start, end):
+                c = buf[p]
+                if c == 46 or c == 101 or c == 69:
+                    has_float_marker = True
+                    break
+            tags[i] = _TAG_FLOAT if has_float_marker else _TAG_STRING
+
+
+def parse_column_jit(values: List[str], null_values: Collection[str]) -> List[Any]:
+    """Parse a column of string values with the Numba cell classifier.
+
+    Joins the column into one contiguous byte buffer plus offset arrays,
+    classifies every cell in compiled code, then materializes Python
+    values from the resulting type tags. Non-ASCII columns fall back to
+    parse_column, which handles the general Unicode rules.
+
+    Args:
+        values: Column of raw string values
+        null_values: Collection of strings to treat as null
+
+    Returns:
+        List of parsed values in the most appropriate types
+    """
+    joined = ''.join(values)
+    if not joined.isascii():
+        return parse_column(values, True, null_values)
+
+    buf = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+    lengths = np.fromiter(
+        (len(value) for value in values), dtype=np.int64, count=len(values)
+    )
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    tags = np.empty(len(values), dtype=np.int8)
+    ints = np.zeros(len(values), dtype=np.int64)
+    _classify_cells(buf, starts, ends, tags, ints)
+
+    out = np.empty(len(values), dtype=object)
+    string_mask = tags == _TAG_STRING
+    if string_mask.any():
+        out[string_mask] = [
+            joined[starts[i]:ends[i]] for i in np.flatnonzero(string_mask)
+        ]
+    int_mask = tags == _TAG_INT
+    out[int_mask] = ints[int_mask].tolist()
+    big_mask = tags == _TAG_INT_BIG
+    if big_mask.any():
+        out[big_mask] = [
+            int(joined[starts[i]:ends[i]]) for i in np.flatnonzero(big_mask)
+        ]
+    float_mask = tags == _TAG_FLOAT
+    if float_mask.any():
+        parsed = []
+        for i in np.flatnonzero(float_mask):
+            value = joined[starts[i]:ends[i]]
+            try:
+                parsed.append(float(value))
+            except ValueError:
+                parsed.append(value)
+        out[float_mask] = parsed
+    out[tags == _TAG_TRUE] = True
+    out[tags == _TAG_FALSE] = False
+    out[tags == _TAG_NULL] = None
+
+    if null_values:
+        raw = np.asarray(values, dtype=object)
+        out[np.isin(raw, np.asarray(list(null_values), dtype=object))] = None
+
+    return out.tolist()
+
+
+# Encodings where a 0x0A byte can only ever be a newline, so the input
+# can be split into lines before decoding.
+_LINE_SAFE_ENCODINGS = frozenset((
+    'ascii', 'utf-8', 'latin-1', 'iso8859-1', 'cp1252'
+))
+
+
+def _open_input(file_path: str, encoding: str) -> Tuple[Any, Any]:
+    """Open a CSV file for reading, memory-mapping it when possible.
+
+    With mmap the OS page cache backs reads directly and the kernel is
+    advised of the sequential access pattern, avoiding the buffered-read
+    copy. Empty files, non-regular files and encodings where lines
+    cannot be split at the byte level fall back to ordinary text I/O.
+
+    Args:
+        file_path: Path to CSV file
+        encoding: File encoding
+
+    Returns:
+        Tuple of (iterable of decoded lines, close callable)
+
+    Raises:
+        FileNotFoundError: If the input file does not exist
+    """
+    try:
+        normalized = codecs.lookup(encoding).name
+    except LookupError:
+        normalized = None
+
+    if normalized in _LINE_SAFE_ENCODINGS:
+        rawfile = open(file_path, 'rb')
+        try:
+            mapped = mmap.mmap(rawfile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            rawfile.close()
+        else:
+            if hasattr(mapped, 'madvise'):
+                try:
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                except (ValueError, OSError):
+                    pass
+
+            def lines():
+                for raw_line in iter(mapped.readline, b''):
+                    yield raw_line.decode(encoding)
+
+            def close():
+                mapped.close()
+                rawfile.close()
+
+            return lines(), close
+
+    textfile = open(file_path, 'r', encoding=encoding, newline='')
+    return textfile, textfile.close
+
+
 def read_csv_file(
     file_path: str,
     delimiter: str,
@@ -238,25 +931,28 @@ def read_csv_file(
         csv.Error: If there is an error parsing the CSV file
     """
     try:
-        with open(file_path, 'r', encoding=encoding, newline='') as csvfile:
+        lines, close = _open_input(file_path, encoding)
+        try:
             reader = csv.reader(
-                csvfile,
+                lines,
                 delimiter=delimiter,
                 quotechar=quotechar,
                 quoting=quoting,
                 skipinitialspace=skipinitialspace
             )
-            
+
             # Read header row
             try:
                 headers = next(reader)
             except StopIteration:
                 raise ValueError("CSV file is empty or has no headers")
-            
+
             # Read data rows
             rows = list(reader)
-            
+
             return headers, rows
+        finally:
+            close()
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file not found: {file_path}")
     except csv.Error as e:
@@ -265,50 +961,578 @@ def read_csv_file(
         raise Exception(f"Unexpected error reading CSV file: {e}")
 
 
+class ColumnTable:
+    """Column-oriented (struct-of-arrays) view of converted CSV data.
+
+    Holds one parsed list per column instead of one dict per row, so a
+    batch of rows carries no per-row dict overhead until a consumer asks
+    for row form. Rows are materialized on demand: the iter_* methods
+    build one row at a time, which lets the streaming writer serialize
+    and discard each row immediately.
+    """
+
+    __slots__ = ('headers', 'columns')
+
+    def __init__(self, headers: List[str], columns: List[List[Any]]):
+        self.headers = headers
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def iter_objects(self) -> Any:
+        """Yield one dict per row, built on demand."""
+        headers = self.headers
+        for record in zip(*self.columns):
+            yield dict(zip(headers, record))
+
+    def iter_rows(self) -> Any:
+        """Yield one list per row (records form, no header row)."""
+        for record in zip(*self.columns):
+            yield list(record)
+
+    def to_objects(self) -> List[Dict[str, Any]]:
+        """Materialize the full array-of-objects form."""
+        return list(self.iter_objects())
+
+    def to_records(self) -> List[List[Any]]:
+        """Materialize the full array-of-arrays form (no header row)."""
+        return list(self.iter_rows())
+
+
+def _parse_columns(
+    headers: List[str],
+    rows: List[List[str]],
+    auto_types: bool,
+    null_values: Collection[str]
+) -> Optional[ColumnTable]:
+    """Parse a batch of rows into columnar form, if the batch allows it.
+
+    Transposes the rows and runs type inference one column at a time with
+    the NumPy/Numba kernels, so the cost per cell is a vectorized C
+    operation rather than a Python function call. Returns None when the
+    columnar path does not apply (NumPy missing, empty batch, or ragged
+    rows that need padding).
+    """
+    if np is None or not rows:
+        return None
+    if any(len(row) != len(headers) for row in rows):
+        return None
+    use_jit = njit is not None and auto_types and len(rows) >= _JIT_MIN_COLUMN
+    columns = [
+        parse_column_jit(list(column), null_values)
+        if use_jit
+        else parse_column(list(column), auto_types, null_values, compact=True)
+        for column in zip(*rows)
+    ]
+    return ColumnTable(headers, columns)
+
+
+# Cache of exec-compiled row builders, keyed by header tuple. Bounded so
+# pathological inputs with ever-changing headers cannot grow it forever.
+_ROW_BUILDER_CACHE: Dict[Tuple[str, ...], Any] = {}
+_ROW_BUILDER_CACHE_MAX = 128
+
+
+def _compile_row_builder(headers: List[str]) -> Any:
+    """Compile a row-to-dict function specialized to one header list.
+
+    Once the headers are known, the per-column loop can be unrolled into
+    a single dict literal with constant keys and constant indices,
+    removing the per-row enumerate/bounds bookkeeping. Compiled builders
+    are cached per header tuple, so the exec cost is paid once per shape.
+
+    Args:
+        headers: List of column headers
+
+    Returns:
+        Function of (row, make_value) returning the row dict
+    """
+    key = tuple(headers)
+    builder = _ROW_BUILDER_CACHE.get(key)
+    if builder is None:
+        items = ', '.join(
+            f'{header!r}: make_value(row[{i}])'
+            for i, header in enumerate(headers)
+        )
+        source = f'def row_builder(row, make_value):\n    return {{{items}}}'
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, '<row_builder>', 'exec'), namespace)
+        builder = namespace['row_builder']
+        if len(_ROW_BUILDER_CACHE) >= _ROW_BUILDER_CACHE_MAX:
+            _ROW_BUILDER_CACHE.clear()
+        _ROW_BUILDER_CACHE[key] = builder
+    return builder
+
+
+def _convert_rows(
+    headers: List[str],
+    rows: List[List[str]],
+    as_records: bool,
+    auto_types: bool,
+    null_values: Collection[str],
+    lazy: bool = False
+) -> List[Any]:
+    """Convert a batch of data rows (without the header row) to JSON form.
+
+    Shared core of csv_to_json and iter_records: csv_to_json prepends the
+    header row in records mode, iter_records calls this once per chunk.
+    """
+    if not lazy:
+        table = _parse_columns(headers, rows, auto_types, null_values)
+        if table is not None:
+            return table.to_records() if as_records else table.to_objects()
+
+    if lazy and auto_types:
+        def make_value(value: str) -> Any:
+            return PendingValue(value, null_values)
+    elif not auto_types:
+        # No inference to do: just map the null sentinels.
+        def make_value(value: str) -> Any:
+            return None if value in null_values else value
+    else:
+        def make_value(value: str) -> Any:
+            return try_parse_value(value, auto_types, null_values)
+
+    num_headers = len(headers)
+    result = []
+    if as_records:
+        # Convert to array of arrays
+        for row in rows:
+            # Convert values to appropriate types, truncated to headers
+            parsed_row = [make_value(val) for val in row[:num_headers]]
+            # Ensure row has the same length as headers
+            if len(parsed_row) < num_headers:
+                parsed_row.extend([None] * (num_headers - len(parsed_row)))
+            result.append(parsed_row)
+    else:
+        # Convert to array of objects with a builder specialized to this
+        # header shape: constant keys and indices, no per-row loop
+        build_row = _compile_row_builder(headers)
+        for row in rows:
+            if len(row) >= num_headers:
+                result.append(build_row(row, make_value))
+            else:
+                # Short row: pad the missing trailing cells with None
+                result.append({
+                    header: make_value(value) if value is not None else None
+                    for header, value in itertools.zip_longest(headers, row)
+                })
+
+    return result
+
+
 def csv_to_json(
     headers: List[str],
     rows: List[List[str]],
     as_records: bool,
     auto_types: bool,
-    null_values: List[str]
+    null_values: Collection[str],
+    lazy: bool = False
 ) -> List[Any]:
     """Convert CSV data to JSON-compatible Python structure.
-    
+
     Args:
         headers: List of column headers
         rows: List of data rows
         as_records: Whether to output as array of arrays
         auto_types: Whether to automatically convert types
-        null_values: List of strings to treat as null
-        
+        null_values: Collection of strings to treat as null
+        lazy: Store cells as PendingValue and defer type inference until
+            each value is first used (resolved automatically by
+            LazyValueEncoder at serialization time)
+
     Returns:
         JSON-compatible Python structure
     """
+    result = _convert_rows(headers, rows, as_records, auto_types, null_values, lazy)
     if as_records:
-        # Convert to array of arrays with header as first row
-        result = [headers]
-        for row in rows:
-            # Convert values to appropriate types
-            parsed_row = [try_parse_value(val, auto_types, null_values) for val in row]
-            # Ensure row has the same length as headers
-            while len(parsed_row) < len(headers):
-                parsed_row.append(None)
-            result.append(parsed_row[:len(headers)])
-    else:
-        # Convert to array of objects
-        result = []
-        for row in rows:
-            row_obj = {}
-            for i, header in enumerate(headers):
-                if i < len(row):
-                    row_obj[header] = try_parse_value(row[i], auto_types, null_values)
-                else:
-                    row_obj[header] = None
-            result.append(row_obj)
-    
+        # Header row comes first in records mode
+        return [headers] + result
     return result
 
 
+def iter_records(
+    file_path: str,
+    delimiter: str = ',',
+    quotechar: str = '"',
+    quoting: int = csv.QUOTE_MINIMAL,
+    skipinitialspace: bool = False,
+    encoding: str = 'utf-8',
+    as_records: bool = False,
+    auto_types: bool = True,
+    null_values: Optional[Collection[str]] = None,
+    chunk_size: int = 4096
+) -> Any:
+    """Stream converted records from a CSV file one at a time.
+
+    Reads, parses and converts in one pipelined pass so only chunk_size
+    raw rows are ever resident, instead of materializing the whole file
+    as in read_csv_file + csv_to_json. Rows are converted in chunks so
+    the columnar fast paths still apply.
+
+    Args:
+        file_path: Path to CSV file
+        delimiter: CSV delimiter character
+        quotechar: CSV quote character
+        quoting: CSV quoting mode
+        skipinitialspace: Whether to skip initial spaces
+        encoding: File encoding
+        as_records: Whether to yield rows as arrays (header row first)
+        auto_types: Whether to automatically convert types
+        null_values: Collection of strings to treat as null
+        chunk_size: Number of raw rows converted per batch
+
+    Returns:
+        Generator yielding one converted record at a time
+
+    Raises:
+        FileNotFoundError: If the input file does not exist
+        ValueError: If the CSV file is empty or has no headers
+        csv.Error: If there is an error parsing the CSV file
+    """
+    if null_values is None:
+        null_values = _DEFAULT_NULL_VALUES
+
+    # Open eagerly so missing-file and empty-file errors surface before
+    # any output is produced.
+    try:
+        lines, close = _open_input(file_path, encoding)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+
+    try:
+        reader = csv.reader(
+            lines,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            quoting=quoting,
+            skipinitialspace=skipinitialspace
+        )
+        try:
+            headers = next(reader)
+        except StopIteration:
+            raise ValueError("CSV file is empty or has no headers")
+    except BaseException:
+        close()
+        raise
+
+    def convert_chunk(chunk):
+        # Keep each chunk columnar and materialize one row at a time, so
+        # a full chunk of dicts never exists at once.
+        table = _parse_columns(headers, chunk, auto_types, null_values)
+        if table is not None:
+            return table.iter_rows() if as_records else table.iter_objects()
+        return iter(_convert_rows(
+            headers, chunk, as_records, auto_types, null_values
+        ))
+
+    def generate():
+        try:
+            if as_records:
+                yield headers
+
+            first = list(itertools.islice(reader, chunk_size))
+            if len(first) < chunk_size:
+                # Fits in one chunk: the thread pool is not worth its
+                # startup cost.
+                yield from convert_chunk(first)
+                return
+
+            # Parse chunks in a thread pool while yielding in order. The
+            # NumPy and Numba kernels release the GIL for much of their
+            # work, so chunk parsing overlaps serialization and other
+            # chunks; only the main thread touches the csv reader. The
+            # pending queue bounds resident chunks to the worker count.
+            with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as pool:
+                pending = collections.deque()
+                pending.append(pool.submit(convert_chunk, first))
+                while True:
+                    chunk = list(itertools.islice(reader, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(convert_chunk, chunk))
+                    while len(pending) >= _PARSE_WORKERS:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+        except csv.Error as e:
+            raise csv.Error(f"Error parsing CSV file: {e}")
+        finally:
+            close()
+
+    return generate()
+
+
+def read_csv_arrow(
+    file_path: str,
+    delimiter: str,
+    quotechar: str,
+    as_records: bool,
+    auto_types: bool,
+    null_values: Collection[str],
+    encoding: str = 'utf-8'
+) -> List[Any]:
+    """Read and convert a CSV file with PyArrow's multithreaded reader.
+
+    Replaces the tokenize/parse/convert pipeline with one native call:
+    pyarrow.csv.read_csv does SIMD tokenizing, parallel chunk parsing and
+    column-wise type inference in C++. Type inference follows Arrow's
+    rules rather than try_parse_value's, so results can differ from the
+    python engine in edge cases (e.g. bare 'yes'/'no' stay strings, and
+    date/timestamp columns serialize as ISO 8601 strings).
+
+    Args:
+        file_path: Path to CSV file
+        delimiter: CSV delimiter character
+        quotechar: CSV quote character
+        as_records: Whether to output as array of arrays
+        auto_types: Whether to automatically infer column types
+        null_values: Collection of strings to treat as null
+        encoding: Input file encoding
+
+    Returns:
+        JSON-compatible Python structure
+
+    Raises:
+        ValueError: If pyarrow is not installed
+        FileNotFoundError: If the input file does not exist
+    """
+    if pacsv is None:
+        raise ValueError(
+            "--engine arrow requires pyarrow to be installed"
+        )
+
+    read_options = pacsv.ReadOptions(encoding=encoding)
+    parse_options = pacsv.ParseOptions(
+        delimiter=delimiter, quote_char=quotechar
+    )
+    column_types = None
+    if not auto_types:
+        # Read just the header so every column can be pinned to string.
+        try:
+            with open(file_path, 'r', newline='', encoding=encoding) as csvfile:
+                first_row = next(
+                    csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar),
+                    None
+                )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {file_path}")
+        if not first_row:
+            raise ValueError("CSV file is empty or has no headers")
+        column_types = {name: pa.string() for name in first_row}
+    convert_options = pacsv.ConvertOptions(
+        null_values=list(null_values),
+        strings_can_be_null=True,
+        column_types=column_types
+    )
+
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    except pa.ArrowInvalid as e:
+        raise csv.Error(f"Error parsing CSV file: {e}")
+
+    if as_records:
+        columns = [column.to_pylist() for column in table.columns]
+        return [table.column_names] + [list(record) for record in zip(*columns)]
+    return table.to_pylist()
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Return True if the encoding name resolves to UTF-8."""
+    try:
+        return codecs.lookup(encoding).name == 'utf-8'
+    except LookupError:
+        return False
+
+
+def stream_json(
+    records: Any,
+    output_file: Optional[str],
+    indent: Optional[int],
+    encoding: str
+) -> None:
+    """Write an iterable of records to file or stdout as a JSON array.
+
+    Serializes one record at a time so the full JSON string is never
+    materialized in memory. When the target encoding is UTF-8, records
+    are serialized straight to bytes and written in binary mode, so no
+    intermediate str or second encode pass exists; other encodings take
+    a text-mode path. Output is byte-for-byte identical to json.dumps
+    of the equivalent list.
+
+    Args:
+        records: Iterable of JSON-compatible records
+        output_file: Output file path or None for stdout
+        indent: JSON indentation level or None
+        encoding: File encoding
+
+    Raises:
+        IOError: If there is an error writing to the output file
+    """
+    def emit_bytes(stream: IO[bytes]) -> None:
+        prefix = (' ' * indent).encode('ascii') if indent else b''
+        separator = b',\n' if indent is not None else b','
+        wrote_any = False
+        for record in records:
+            if wrote_any:
+                stream.write(separator)
+            else:
+                stream.write(b'[\n' if indent is not None else b'[')
+                wrote_any = True
+            chunk = dumps_json_bytes(record, indent)
+            if indent:
+                chunk = prefix + chunk.replace(b'\n', b'\n' + prefix)
+            stream.write(chunk)
+        if not wrote_any:
+            stream.write(b'[]')
+        else:
+            stream.write(b'\n]' if indent is not None else b']')
+
+    def emit_text(stream: IO[str]) -> None:
+        prefix = ' ' * indent if indent else ''
+        separator = ',\n' if indent is not None else ','
+        wrote_any = False
+        for record in records:
+            if wrote_any:
+                stream.write(separator)
+            else:
+                stream.write('[\n' if indent is not None else '[')
+                wrote_any = True
+            chunk = dumps_json(record, indent)
+            if indent:
+                chunk = prefix + chunk.replace('\n', '\n' + prefix)
+            stream.write(chunk)
+        if not wrote_any:
+            stream.write('[]')
+        else:
+            stream.write('\n]' if indent is not None else ']')
+
+    try:
+        if _is_utf8(encoding):
+            if output_file:
+                with open(output_file, 'wb') as f:
+                    emit_bytes(f)
+                logging.info("JSON data written to %s", output_file)
+            else:
+                sys.stdout.flush()
+                emit_bytes(sys.stdout.buffer)
+                sys.stdout.buffer.write(b'\n')
+                sys.stdout.buffer.flush()
+        elif output_file:
+            with open(output_file, 'w', encoding=encoding) as f:
+                emit_text(f)
+            logging.info("JSON data written to %s", output_file)
+        else:
+            emit_text(sys.stdout)
+            sys.stdout.write('\n')
+    except IOError as e:
+        raise IOError(f"Error writing to output file: {e}")
+
+
+# Records serialized per dumps_json_bytes call on the fused compact
+# path: large enough to amortize the serializer call and write syscall,
+# small enough that a batch of boxed dicts stays cache-resident between
+# parse and serialize.
+_SERIALIZE_BATCH = 512
+
+
+def convert_stream(
+    input_file: str,
+    output_file: Optional[str],
+    indent: Optional[int] = None,
+    encoding: str = 'utf-8',
+    delimiter: str = ',',
+    quotechar: str = '"',
+    quoting: int = csv.QUOTE_MINIMAL,
+    skipinitialspace: bool = False,
+    as_records: bool = False,
+    auto_types: bool = True,
+    null_values: Optional[Collection[str]] = None,
+    chunk_size: int = 4096
+) -> None:
+    """Convert a CSV file to JSON output in one fused pass.
+
+    Chains the chunked reader/parser (iter_records) straight into the
+    serializer, so each batch of rows is read, parsed and written while
+    still cache-resident; the dataset is never walked as three separate
+    read/convert/dump passes. On the compact UTF-8 path, batches are
+    serialized with a single dumps_json_bytes call and written with a
+    single binary write each, instead of one serializer call per record.
+    Pretty and non-UTF-8 output fall back to the per-record stream_json
+    writer, which already pipelines the same way.
+
+    Args:
+        input_file: Path to CSV file
+        output_file: Output file path or None for stdout
+        indent: JSON indentation level or None for compact output
+        encoding: Character encoding for input and output
+        delimiter: CSV delimiter character
+        quotechar: CSV quote character
+        quoting: CSV quoting mode
+        skipinitialspace: Whether to skip initial spaces
+        as_records: Whether to output as array of arrays
+        auto_types: Whether to automatically convert types
+        null_values: Collection of strings to treat as null
+        chunk_size: Number of raw rows converted per batch
+
+    Raises:
+        FileNotFoundError: If the input file does not exist
+        ValueError: If the CSV file is empty or has no headers
+        csv.Error: If there is an error parsing the CSV file
+        IOError: If there is an error writing to the output file
+    """
+    records = iter_records(
+        input_file,
+        delimiter=delimiter,
+        quotechar=quotechar,
+        quoting=quoting,
+        skipinitialspace=skipinitialspace,
+        encoding=encoding,
+        as_records=as_records,
+        auto_types=auto_types,
+        null_values=null_values,
+        chunk_size=chunk_size
+    )
+
+    if indent is not None or not _is_utf8(encoding):
+        stream_json(records, output_file, indent, encoding)
+        return
+
+    def emit(stream: IO[bytes]) -> None:
+        wrote_any = False
+        while True:
+            batch = list(itertools.islice(records, _SERIALIZE_BATCH))
+            if not batch:
+                break
+            stream.write(b',' if wrote_any else b'[')
+            wrote_any = True
+            # Serialize the whole batch at once and strip its brackets:
+            # byte-identical to per-record dumps joined with ','.
+            stream.write(dumps_json_bytes(batch, None)[1:-1])
+        stream.write(b']' if wrote_any else b'[]')
+
+    try:
+        if output_file:
+            with open(output_file, 'wb') as f:
+                emit(f)
+            logging.info("JSON data written to %s", output_file)
+        else:
+            sys.stdout.flush()
+            emit(sys.stdout.buffer)
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.buffer.flush()
+    except IOError as e:
+        raise IOError(f"Error writing to output file: {e}")
+
+
 def write_json(
     data: Any,
     output_file: Optional[str],
@@ -327,67 +1551,99 @@ def write_json(
         IOError: If there is an error writing to the output file
     """
     try:
-        json_str = json.dumps(data, indent=indent)
-        
-        if output_file:
-            with open(output_file, 'w', encoding=encoding) as f:
-                f.write(json_str)
-            logging.info(f"JSON data written to {output_file}")
+        if _is_utf8(encoding):
+            # Serialize straight to bytes and write in binary mode, so
+            # no intermediate str or second encode pass is built.
+            json_bytes = dumps_json_bytes(data, indent)
+            if output_file:
+                with open(output_file, 'wb') as f:
+                    f.write(json_bytes)
+                logging.info("JSON data written to %s", output_file)
+            else:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(json_bytes)
+                sys.stdout.buffer.write(b'\n')
+                sys.stdout.buffer.flush()
         else:
-            # Write to stdout
-            print(json_str)
+            json_str = dumps_json(data, indent)
+            if output_file:
+                with open(output_file, 'w', encoding=encoding) as f:
+                    f.write(json_str)
+                logging.info("JSON data written to %s", output_file)
+            else:
+                # Write to stdout
+                print(json_str)
     except IOError as e:
         raise IOError(f"Error writing to output file: {e}")
     except Exception as e:
         raise Exception(f"Unexpected error writing JSON: {e}")
 
 
-def main():
-    """Main function that orchestrates the CSV to JSON conversion."""
-    setup_logging()
-    
+def main(argv: Optional[List[str]] = None):
+    """Main function that orchestrates the CSV to JSON conversion.
+
+    Args:
+        argv: Argument list to use instead of sys.argv (for tests and
+            library embedding)
+    """
     try:
         # Parse command line arguments
-        args = parse_arguments()
+        args = parse_arguments(argv)
+
+        setup_logging(args.verbose)
         
         # Process null values
-        null_values = [val.strip() for val in args.null_values.split(',')] if args.null_values else ['']
+        # Frozenset so the per-cell null check is a single hash lookup
+        if args.null_values:
+            null_values = frozenset(
+                val.strip() for val in args.null_values.split(',')
+            )
+        else:
+            null_values = _DEFAULT_NULL_VALUES
         
         # Get CSV quoting mode
         quoting = get_quoting_mode(args.quoting)
         
-        # Read CSV file
-        logging.info(f"Reading CSV file: {args.input_file}")
-        headers, rows = read_csv_file(
-            args.input_file,
-            args.delimiter,
-            args.quotechar,
-            quoting,
-            args.skipinitialspace,
-            args.encoding
-        )
-        
-        # Convert CSV to JSON
-        logging.info("Converting CSV data to JSON")
-        json_data = csv_to_json(
-            headers,
-            rows,
-            args.records,
-            args.auto_types,
-            null_values
-        )
-        
-        # Set indent for pretty printing
-        indent = args.indent if args.pretty else None
-        
-        # Write JSON to output file or stdout
-        logging.info(f"Writing JSON data to: {args.output or 'stdout'}")
-        write_json(
-            json_data,
-            args.output,
-            indent,
-            args.encoding
-        )
+        # Set indent for pretty printing. Unless requested explicitly,
+        # pretty output is reserved for interactive terminals: compact
+        # JSON is faster to encode and smaller to write, and machine
+        # consumers don't care about the indentation.
+        if args.pretty is None:
+            pretty = args.output is None and sys.stdout.isatty()
+        else:
+            pretty = args.pretty
+        indent = args.indent if pretty else None
+
+        # Convert in one fused pass: read, parse and write are pipelined
+        # so only one chunk of rows is resident at a time instead of
+        # three full copies of the dataset.
+        logging.info("Converting %s to JSON at: %s",
+                     args.input_file, args.output or 'stdout')
+        if args.engine == 'arrow':
+            records = read_csv_arrow(
+                args.input_file,
+                args.delimiter,
+                args.quotechar,
+                args.records,
+                args.auto_types,
+                null_values,
+                encoding=args.encoding
+            )
+            stream_json(records, args.output, indent, args.encoding)
+        else:
+            convert_stream(
+                args.input_file,
+                args.output,
+                indent=indent,
+                encoding=args.encoding,
+                delimiter=args.delimiter,
+                quotechar=args.quotechar,
+                quoting=quoting,
+                skipinitialspace=args.skipinitialspace,
+                as_records=args.records,
+                auto_types=args.auto_types,
+                null_values=null_values
+            )
         
         logging.info("Conversion completed successfully")
         
@@ -395,10 +1651,10 @@ def main():
         logging.error(e)
         return 1
     except csv.Error as e:
-        logging.error(f"CSV error: {e}")
+        logging.error("CSV error: %s", e)
         return 1
     except json.JSONDecodeError as e:
-        logging.error(f"JSON error: {e}")
+        logging.error("JSON error: %s", e)
         return 1
     except IOError as e:
         logging.error(e)
@@ -407,7 +1663,7 @@ def main():
         logging.error(e)
         return 1
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        logging.error("Unexpected error: %s", e)
         return 1
     
     return 0
@@ -5,36 +5,41 @@ CSV to JSON Converter Test Script
 This script tests the CSV to JSON converter with various input files and options.
 It helps verify that the converter is functioning correctly before using it with your own data.
 
+Tests call the converter in-process (via csv_to_json.main with an argv
+list) and run concurrently in a process pool, so there is no per-test
+shell or interpreter startup cost.
+
 Usage:
     python test_converter.py
 """
 
 import os
-import subprocess
 import json
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import csv_to_json
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def run_test(test_name, command, expected_json_file=None):
-    """Run a test and check the result."""
-    logger.info(f"Running test: {test_name}")
-    logger.info(f"Command: {command}")
-    
-    # Run the command
-    process = subprocess.run(command, shell=True, capture_output=True, text=True)
-    
+
+def run_conversion(argv):
+    """Run the converter in this process with the given argv list."""
+    return csv_to_json.main(argv)
+
+
+def check_result(test_name, returncode, expected_json_file=None):
+    """Check the result of a completed conversion."""
     # Check return code
-    if process.returncode != 0:
-        logger.error(f"Test failed! Return code: {process.returncode}")
-        logger.error(f"Error output: {process.stderr}")
+    if returncode != 0:
+        logger.error(f"Test failed! Return code: {returncode}")
         return False
-        
-    logger.info("Command completed successfully")
-    
+
+    logger.info("Conversion completed successfully")
+
     # If we have an expected JSON file, verify the output
     if expected_json_file and os.path.exists(expected_json_file):
         try:
@@ -49,70 +54,96 @@ def run_test(test_name, command, expected_json_file=None):
         except Exception as e:
             logger.error(f"Error checking output file: {e}")
             return False
-    
+
     return True
 
+
 def main():
     """Run all tests."""
     tests = [
         {
             "name": "Simple CSV Test",
-            "command": "python csv_to_json.py simple.csv -o simple_test.json",
+            "argv": ["simple.csv", "-o", "simple_test.json"],
             "output_file": "simple_test.json"
         },
         {
             "name": "CSV with Missing Values",
-            "command": "python csv_to_json.py average.csv -o average_test.json",
-            "output_file": "average_test.json" 
+            "argv": ["average.csv", "-o", "average_test.json"],
+            "output_file": "average_test.json"
         },
         {
             "name": "Complex CSV with Quoted Values",
-            "command": "python csv_to_json.py complex.csv -o complex_test.json -d ',' -q '\"'",
+            "argv": ["complex.csv", "-o", "complex_test.json", "-d", ",", "-q", '"'],
             "output_file": "complex_test.json"
         },
         {
             "name": "TSV File Test",
-            "command": "python csv_to_json.py sample.tsv -d $'\\t' -o tsv_test.json",
+            "argv": ["sample.tsv", "-d", "\t", "-o", "tsv_test.json"],
             "output_file": "tsv_test.json"
         },
         {
             "name": "No Auto-Types Test",
-            "command": "python csv_to_json.py custom_types.csv -o types_test.json --no-auto-types",
+            "argv": ["custom_types.csv", "-o", "types_test.json", "--no-auto-types"],
             "output_file": "types_test.json"
         },
         {
             "name": "Records Format Test (Array of Arrays)",
-            "command": "python csv_to_json.py simple.csv -o records_test.json -r",
+            "argv": ["simple.csv", "-o", "records_test.json", "-r"],
             "output_file": "records_test.json"
         }
     ]
-    
+
+    # Arrow engine smoke test: pyarrow is optional, so only run it when
+    # installed. -p exercises the stdlib encoder on Arrow's inferred
+    # date/timestamp columns.
+    if csv_to_json.pacsv is not None:
+        tests.append({
+            "name": "Arrow Engine Date Test",
+            "argv": ["dates.csv", "-o", "arrow_dates_test.json",
+                     "--engine", "arrow", "-p"],
+            "output_file": "arrow_dates_test.json"
+        })
+
     # Create a test directory if it doesn't exist
     os.makedirs("test_output", exist_ok=True)
-    
-    # Run all tests
-    passed = 0
-    total = len(tests)
-    
+
+    # Update output paths to use the test directory
     for test in tests:
-        # Update output path to use test directory
         if "output_file" in test:
-            test["output_file"] = os.path.join("test_output", test["output_file"])
-            # Update command to reflect new output path
-            test["command"] = test["command"].replace(
-                os.path.basename(test["output_file"]), 
-                test["output_file"]
-            )
-        
-        if run_test(test["name"], test["command"], test.get("output_file")):
-            passed += 1
-            logger.info(f"Test passed: {test['name']}\n")
-        else:
-            logger.error(f"Test failed: {test['name']}\n")
-    
+            output_file = os.path.join("test_output", test["output_file"])
+            test["argv"] = [
+                output_file if arg == test["output_file"] else arg
+                for arg in test["argv"]
+            ]
+            test["output_file"] = output_file
+
+    # Run all tests concurrently; each worker calls the converter
+    # in-process, amortizing interpreter startup over the whole batch
+    passed = 0
+    total = len(tests)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [pool.submit(run_conversion, test["argv"]) for test in tests]
+
+        for test, future in zip(tests, futures):
+            logger.info(f"Running test: {test['name']}")
+            logger.info(f"Arguments: {test['argv']}")
+            try:
+                returncode = future.result()
+            except Exception as e:
+                logger.error(f"Test raised an exception: {e}")
+                logger.error(f"Test failed: {test['name']}\n")
+                continue
+
+            if check_result(test["name"], returncode, test.get("output_file")):
+                passed += 1
+                logger.info(f"Test passed: {test['name']}\n")
+            else:
+                logger.error(f"Test failed: {test['name']}\n")
+
     # Print summary
     logger.info(f"Test summary: {passed} of {total} tests passed")
-    
+
     if passed == total:
         logger.info("All tests passed! The CSV to JSON converter is working correctly.")
         return 0
@@ -120,5 +151,6 @@ def main():
         logger.error("Some tests failed. Please check the output for details.")
         return 1
 
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())